@@ -28,6 +28,8 @@ options:
     type: int
     description:
     - Time to wait before every attempt to check the state of the resource.
+    - The first retry waits I(wait_sleep_time) again, then the delay is doubled after each unsuccessful attempt.
+    - The delay is capped to 30 seconds, or I(wait_sleep_time) if greater.
     required: false
     default: 3
 '''
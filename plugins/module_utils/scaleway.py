@@ -7,6 +7,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
+import random
 import re
 import sys
 import datetime
@@ -14,6 +15,7 @@ import time
 import traceback
 
 from ansible.module_utils.basic import env_fallback, missing_required_lib
+from ansible.module_utils.common.text.converters import jsonify, to_native
 from ansible.module_utils.urls import fetch_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 
@@ -27,6 +29,10 @@ except Exception:
     HAS_SCALEWAY_SECRET_PACKAGE = False
 
 
+# Upper bound of the delay between two state checks once the backoff has grown
+SCALEWAY_WAIT_MAX_SLEEP_TIME = 30
+
+
 def scaleway_argument_spec():
     return dict(
         api_token=dict(required=True, fallback=(env_fallback, ['SCW_TOKEN', 'SCW_API_KEY', 'SCW_OAUTH_TOKEN', 'SCW_API_TOKEN']),
@@ -90,6 +96,16 @@ def filter_sensitive_attributes(container, attributes):
     return container
 
 
+def sensitive_attributes_hook(attributes):
+    def hook(obj):
+        for attr in attributes:
+            if attr in obj:
+                obj[attr] = "SENSITIVE_VALUE"
+        return obj
+
+    return hook
+
+
 class SecretVariables(object):
     @staticmethod
     def ensure_scaleway_secret_package(module):
@@ -102,8 +118,8 @@ class SecretVariables(object):
     @staticmethod
     def dict_to_list(source_dict):
         return [
-            dict(key=var[0], value=var[1])
-            for var in source_dict.items()
+            {"key": key, "value": value}
+            for key, value in source_dict.items()
         ]
 
     @staticmethod
@@ -131,31 +147,37 @@ class SecretVariables(object):
 def resource_attributes_should_be_changed(target, wished, verifiable_mutable_attributes, mutable_attributes):
     diff = dict()
     for attr in verifiable_mutable_attributes:
-        if wished[attr] is not None and target[attr] != wished[attr]:
+        if wished.get(attr) is not None and target[attr] != wished[attr]:
             diff[attr] = wished[attr]
 
     if diff:
-        return dict((attr, wished[attr]) for attr in mutable_attributes)
+        return dict((attr, wished[attr]) for attr in mutable_attributes if attr in wished)
     else:
         return diff
 
 
 class Response(object):
 
-    def __init__(self, resp, info):
+    def __init__(self, resp, info, sensitive_attributes=None):
         self.body = None
         if resp:
             self.body = resp.read()
         self.info = info
+        self.sensitive_attributes = sensitive_attributes
 
     @property
     def json(self):
+        # Redact sensitive attributes while parsing, so they never reach the module
+        object_hook = None
+        if self.sensitive_attributes:
+            object_hook = sensitive_attributes_hook(self.sensitive_attributes)
+
         if not self.body:
             if "body" in self.info:
-                return json.loads(self.info["body"])
+                return json.loads(self.info["body"], object_hook=object_hook)
             return None
         try:
-            return json.loads(self.body)
+            return json.loads(self.body, object_hook=object_hook)
         except ValueError:
             return None
 
@@ -178,6 +200,7 @@ class Scaleway(object):
             'Content-Type': 'application/json',
         }
         self.name = None
+        self.sensitive_attributes = None
 
     def get_resources(self):
         results = self.get('/%s' % self.name)
@@ -191,7 +214,7 @@ class Scaleway(object):
         return results.json.get(self.name)
 
     def _url_builder(self, path, params):
-        d = self.module.params.get('query_parameters')
+        d = dict(self.module.params.get('query_parameters'))
         if params is not None:
             d.update(params)
         query_string = urlencode(d, doseq=True)
@@ -207,8 +230,12 @@ class Scaleway(object):
         if headers is not None:
             self.headers.update(headers)
 
-        if self.headers['Content-Type'] == "application/json":
-            data = self.module.jsonify(data)
+        # Compact JSON, and no "null" body for requests without payload
+        if data is not None and self.headers['Content-Type'] == "application/json":
+            try:
+                data = jsonify(data, separators=(',', ':'))
+            except UnicodeError as e:
+                self.module.fail_json(msg=to_native(e))
 
         resp, info = fetch_url(
             self.module, url, data=data, headers=self.headers, method=method,
@@ -219,7 +246,7 @@ class Scaleway(object):
         if info['status'] == -1:
             self.module.fail_json(msg=info['msg'])
 
-        return Response(resp, info)
+        return Response(resp, info, sensitive_attributes=self.sensitive_attributes)
 
     @staticmethod
     def get_user_agent_string(module):
@@ -246,58 +273,88 @@ class Scaleway(object):
     def warn(self, x):
         self.module.warn(str(x))
 
-    def fetch_state(self, resource):
-        self.module.debug("fetch_state of resource: %s" % resource["id"])
-        response = self.get(path=self.api_path + "/%s" % resource["id"])
+    def fetch_resource(self, resource):
+        self.module.debug("fetch_resource: %s" % resource["id"])
+        response = self.get(path="%s/%s" % (self.api_path, resource["id"]))
 
         if response.status_code == 404:
-            return "absent"
+            return "absent", None
 
+        body = response.json
         if not response.ok:
-            msg = 'Error during state fetching: (%s) %s' % (response.status_code, response.json)
+            msg = 'Error during state fetching: (%s) %s' % (response.status_code, body)
             self.module.fail_json(msg=msg)
 
         try:
-            self.module.debug("Resource %s in state: %s" % (resource["id"], response.json["status"]))
-            return response.json["status"]
+            self.module.debug("Resource %s in state: %s" % (resource["id"], body["status"]))
+            return body["status"], body
         except KeyError:
-            self.module.fail_json(msg="Could not fetch state in %s" % response.json)
+            self.module.fail_json(msg="Could not fetch state in %s" % body)
 
-    def fetch_paginated_resources(self, resource_key, **pagination_kwargs):
+    def fetch_state(self, resource):
+        state, dummy = self.fetch_resource(resource)
+        return state
+
+    def fetch_resource_details(self, resource, detail_attributes, resource_label):
+        # The listing usually returns complete resources, only fetch the resource again when it does not
+        if all(attr in resource for attr in detail_attributes):
+            return resource
+
+        response = self.get(path="%s/%s" % (self.api_path, resource["id"]))
+        body = response.json
+        if not response.ok:
+            msg = "Error during %s lookup: %s: '%s' (%s)" % (resource_label, response.info['msg'], body['message'], body)
+            self.module.fail_json(msg=msg)
+
+        return body
+
+    def fetch_resources_page(self, resource_key, **pagination_kwargs):
         response = self.get(
             path=self.api_path,
             params=pagination_kwargs)
 
-        status_code = response.status_code
+        body = response.json
         if not response.ok:
             self.module.fail_json(msg='Error getting {0} [{1}: {2}]'.format(
                 resource_key,
-                response.status_code, response.json['message']))
+                response.status_code, body['message']))
 
-        return response.json[resource_key]
+        return body[resource_key], body.get("total_count")
 
-    def fetch_all_resources(self, resource_key, **pagination_kwargs):
-        resources = []
+    def fetch_paginated_resources(self, resource_key, **pagination_kwargs):
+        resources, dummy = self.fetch_resources_page(resource_key, **pagination_kwargs)
+        return resources
+
+    def iter_all_resources(self, resource_key, **pagination_kwargs):
+        fetched_count = 0
+
+        while True:
+            result, total_count = self.fetch_resources_page(resource_key, **pagination_kwargs)
+            for resource in result:
+                yield resource
+            fetched_count += len(result)
+
+            # Do not request one more page when the API tells us everything has been fetched
+            if not result or (total_count is not None and fetched_count >= total_count):
+                break
 
-        result = [None]
-        while len(result) != 0:
-            result = self.fetch_paginated_resources(resource_key, **pagination_kwargs)
-            resources += result
             if 'page' in pagination_kwargs:
                 pagination_kwargs['page'] += 1
             else:
                 pagination_kwargs['page'] = 2
 
-        return resources
+    def fetch_all_resources(self, resource_key, **pagination_kwargs):
+        return list(self.iter_all_resources(resource_key, **pagination_kwargs))
 
     def wait_to_complete_state_transition(self, resource, stable_states, force_wait=False):
         wait = self.module.params["wait"]
 
         if not (wait or force_wait):
-            return
+            return resource
 
         wait_timeout = self.module.params["wait_timeout"]
         wait_sleep_time = self.module.params["wait_sleep_time"]
+        wait_max_sleep_time = max(wait_sleep_time, SCALEWAY_WAIT_MAX_SLEEP_TIME)
 
         # Prevent requesting the ressource status too soon
         time.sleep(wait_sleep_time)
@@ -305,18 +362,27 @@ class Scaleway(object):
         start = datetime.datetime.utcnow()
         end = start + datetime.timedelta(seconds=wait_timeout)
 
-        while datetime.datetime.utcnow() < end:
+        attempt = 0
+        while True:
             self.module.debug("We are going to wait for the resource to finish its transition")
 
-            state = self.fetch_state(resource)
+            state, fetched_resource = self.fetch_resource(resource)
             if state in stable_states:
                 self.module.debug("It seems that the resource is not in transition anymore.")
-                self.module.debug("load-balancer in state: %s" % self.fetch_state(resource))
+                self.module.debug("Resource in state: %s" % state)
+                return fetched_resource
+
+            remaining_time = (end - datetime.datetime.utcnow()).total_seconds()
+            if remaining_time <= 0:
                 break
 
-            time.sleep(wait_sleep_time)
-        else:
-            self.module.fail_json(msg="Server takes too long to finish its transition")
+            # Exponential backoff with jitter, so that slow transitions do not hammer the API.
+            # Never sleep past the timeout, the last attempt is made at the deadline.
+            sleep_time = min(wait_sleep_time * (2 ** attempt), wait_max_sleep_time) * random.uniform(0.8, 1.2)
+            time.sleep(min(sleep_time, wait_max_sleep_time, remaining_time))
+            attempt += 1
+
+        self.module.fail_json(msg="Server takes too long to finish its transition")
 
 
 SCALEWAY_LOCATION = {
@@ -128,20 +128,20 @@ from copy import deepcopy
 from ansible_collections.community.general.plugins.module_utils.scaleway import (
     SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway,
     scaleway_waitable_resource_argument_spec,
-    resource_attributes_should_be_changed, SecretVariables
+    resource_attributes_should_be_changed, payload_from_object, SecretVariables
 )
 from ansible.module_utils.basic import AnsibleModule
 
-STABLE_STATES = (
+STABLE_STATES = frozenset({
     "ready",
     "absent"
-)
+})
 
-MUTABLE_ATTRIBUTES = (
+MUTABLE_ATTRIBUTES = frozenset({
     "description",
     "environment_variables",
     "secret_environment_variables"
-)
+})
 
 
 def payload_from_wished_cn(wished_cn):
@@ -153,26 +153,26 @@ def payload_from_wished_cn(wished_cn):
         "secret_environment_variables": SecretVariables.dict_to_list(wished_cn["secret_environment_variables"])
     }
 
-    return payload
+    return payload_from_object(payload)
 
 
 def absent_strategy(api, wished_cn):
     changed = False
 
-    cn_list = api.fetch_all_resources("namespaces")
-    cn_lookup = dict((cn["name"], cn)
-                     for cn in cn_list)
+    target_cn = next((cn for cn in api.iter_all_resources("namespaces", name=wished_cn["name"], project_id=wished_cn["project_id"])
+                      if cn["name"] == wished_cn["name"]), None)
 
-    if wished_cn["name"] not in cn_lookup:
+    if target_cn is None:
         return changed, {}
 
-    target_cn = cn_lookup[wished_cn["name"]]
     changed = True
     if api.module.check_mode:
         return changed, {"status": "Container namespace would be destroyed"}
 
-    api.wait_to_complete_state_transition(resource=target_cn, stable_states=STABLE_STATES, force_wait=True)
-    response = api.delete(path=api.api_path + "/%s" % target_cn["id"])
+    if target_cn.get("status") not in STABLE_STATES:
+        api.wait_to_complete_state_transition(resource=target_cn, stable_states=STABLE_STATES, force_wait=True)
+
+    response = api.delete(path="%s/%s" % (api.api_path, target_cn["id"]))
     if not response.ok:
         api.module.fail_json(msg='Error deleting container namespace [{0}: {1}]'.format(
             response.status_code, response.json))
@@ -184,13 +184,12 @@ def absent_strategy(api, wished_cn):
 def present_strategy(api, wished_cn):
     changed = False
 
-    cn_list = api.fetch_all_resources("namespaces")
-    cn_lookup = dict((cn["name"], cn)
-                     for cn in cn_list)
+    target_cn = next((cn for cn in api.iter_all_resources("namespaces", name=wished_cn["name"], project_id=wished_cn["project_id"])
+                      if cn["name"] == wished_cn["name"]), None)
 
     payload_cn = payload_from_wished_cn(wished_cn)
 
-    if wished_cn["name"] not in cn_lookup:
+    if target_cn is None:
         changed = True
         if api.module.check_mode:
             return changed, {"status": "A container namespace would be created."}
@@ -201,16 +200,15 @@ def present_strategy(api, wished_cn):
                                      data=payload_cn)
 
         if not creation_response.ok:
+            body = creation_response.json
             msg = "Error during container namespace creation: %s: '%s' (%s)" % (creation_response.info['msg'],
-                                                                                creation_response.json['message'],
-                                                                                creation_response.json)
+                                                                                body['message'],
+                                                                                body)
             api.module.fail_json(msg=msg)
 
-        api.wait_to_complete_state_transition(resource=creation_response.json, stable_states=STABLE_STATES)
-        response = api.get(path=api.api_path + "/%s" % creation_response.json["id"])
-        return changed, response.json
+        created_cn = api.wait_to_complete_state_transition(resource=creation_response.json, stable_states=STABLE_STATES)
+        return changed, created_cn
 
-    target_cn = cn_lookup[wished_cn["name"]]
     decoded_target_cn = deepcopy(target_cn)
     decoded_target_cn["secret_environment_variables"] = SecretVariables.decode(decoded_target_cn["secret_environment_variables"],
                                                                                payload_cn["secret_environment_variables"])
@@ -226,16 +224,15 @@ def present_strategy(api, wished_cn):
     if api.module.check_mode:
         return changed, {"status": "Container namespace attributes would be changed."}
 
-    cn_patch_response = api.patch(path=api.api_path + "/%s" % target_cn["id"],
+    cn_patch_response = api.patch(path="%s/%s" % (api.api_path, target_cn["id"]),
                                   data=patch_payload)
 
     if not cn_patch_response.ok:
         api.module.fail_json(msg='Error during container namespace attributes update: [{0}: {1}]'.format(
             cn_patch_response.status_code, cn_patch_response.json['message']))
 
-    api.wait_to_complete_state_transition(resource=target_cn, stable_states=STABLE_STATES)
-    response = api.get(path=api.api_path + "/%s" % target_cn["id"])
-    return changed, cn_patch_response.json
+    updated_cn = api.wait_to_complete_state_transition(resource=cn_patch_response.json, stable_states=STABLE_STATES)
+    return changed, updated_cn
 
 
 state_strategy = {
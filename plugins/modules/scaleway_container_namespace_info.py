@@ -78,52 +78,49 @@ container_namespace:
 '''
 
 from ansible_collections.community.general.plugins.module_utils.scaleway import (
-    SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway,
-    filter_sensitive_attributes
+    SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway
 )
 from ansible.module_utils.basic import AnsibleModule
 
-SENSITIVE_ATTRIBUTES = (
+SENSITIVE_ATTRIBUTES = frozenset({
     "secret_environment_variables",
-)
+})
+
+DETAIL_ATTRIBUTES = frozenset({
+    "environment_variables",
+    "secret_environment_variables",
+    "registry_endpoint",
+    "status",
+})
 
 
 def info_strategy(api, wished_cn):
-    cn_list = api.fetch_all_resources("namespaces")
-    cn_lookup = dict((fn["name"], fn)
-                     for fn in cn_list)
+    target_cn = next((cn for cn in api.iter_all_resources("namespaces", name=wished_cn["name"], project_id=wished_cn["project_id"])
+                      if cn["name"] == wished_cn["name"]), None)
 
-    if wished_cn["name"] not in cn_lookup:
+    if target_cn is None:
         msg = "Error during container namespace lookup: Unable to find container namespace named '%s' in project '%s'" % (wished_cn["name"],
                                                                                                                           wished_cn["project_id"])
 
         api.module.fail_json(msg=msg)
 
-    target_cn = cn_lookup[wished_cn["name"]]
-
-    response = api.get(path=api.api_path + "/%s" % target_cn["id"])
-    if not response.ok:
-        msg = "Error during container namespace lookup: %s: '%s' (%s)" % (response.info['msg'],
-                                                                          response.json['message'],
-                                                                          response.json)
-        api.module.fail_json(msg=msg)
-
-    return response.json
+    return api.fetch_resource_details(target_cn, DETAIL_ATTRIBUTES, "container namespace")
 
 
 def core(module):
-    region = module.params["region"]
+    params = module.params
     wished_container_namespace = {
-        "project_id": module.params["project_id"],
-        "name": module.params["name"]
+        "project_id": params["project_id"],
+        "name": params["name"]
     }
 
     api = Scaleway(module=module)
-    api.api_path = "containers/v1beta1/regions/%s/namespaces" % region
+    api.api_path = "containers/v1beta1/regions/%s/namespaces" % params["region"]
+    api.sensitive_attributes = SENSITIVE_ATTRIBUTES
 
     summary = info_strategy(api=api, wished_cn=wished_container_namespace)
 
-    module.exit_json(changed=False, container_namespace=filter_sensitive_attributes(summary, SENSITIVE_ATTRIBUTES))
+    module.exit_json(changed=False, container_namespace=summary)
 
 
 def main():
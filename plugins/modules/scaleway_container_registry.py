@@ -114,19 +114,20 @@ container_registry:
 
 from ansible_collections.community.general.plugins.module_utils.scaleway import (
     SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway,
-    scaleway_waitable_resource_argument_spec, resource_attributes_should_be_changed
+    scaleway_waitable_resource_argument_spec, resource_attributes_should_be_changed,
+    payload_from_object
 )
 from ansible.module_utils.basic import AnsibleModule
 
-STABLE_STATES = (
+STABLE_STATES = frozenset({
     "ready",
     "absent"
-)
+})
 
-MUTABLE_ATTRIBUTES = (
+MUTABLE_ATTRIBUTES = frozenset({
     "description",
     "is_public"
-)
+})
 
 
 def payload_from_wished_cr(wished_cr):
@@ -137,26 +138,26 @@ def payload_from_wished_cr(wished_cr):
         "is_public": wished_cr["privacy_policy"] == "public"
     }
 
-    return payload
+    return payload_from_object(payload)
 
 
 def absent_strategy(api, wished_cr):
     changed = False
 
-    cr_list = api.fetch_all_resources("namespaces")
-    cr_lookup = dict((cr["name"], cr)
-                     for cr in cr_list)
+    target_cr = next((cr for cr in api.iter_all_resources("namespaces", name=wished_cr["name"], project_id=wished_cr["project_id"])
+                      if cr["name"] == wished_cr["name"]), None)
 
-    if wished_cr["name"] not in cr_lookup:
+    if target_cr is None:
         return changed, {}
 
-    target_cr = cr_lookup[wished_cr["name"]]
     changed = True
     if api.module.check_mode:
         return changed, {"status": "Container registry would be destroyed"}
 
-    api.wait_to_complete_state_transition(resource=target_cr, stable_states=STABLE_STATES, force_wait=True)
-    response = api.delete(path=api.api_path + "/%s" % target_cr["id"])
+    if target_cr.get("status") not in STABLE_STATES:
+        api.wait_to_complete_state_transition(resource=target_cr, stable_states=STABLE_STATES, force_wait=True)
+
+    response = api.delete(path="%s/%s" % (api.api_path, target_cr["id"]))
     if not response.ok:
         api.module.fail_json(msg='Error deleting container registry [{0}: {1}]'.format(
             response.status_code, response.json))
@@ -168,13 +169,12 @@ def absent_strategy(api, wished_cr):
 def present_strategy(api, wished_cr):
     changed = False
 
-    cr_list = api.fetch_all_resources("namespaces")
-    cr_lookup = dict((cr["name"], cr)
-                     for cr in cr_list)
+    target_cr = next((cr for cr in api.iter_all_resources("namespaces", name=wished_cr["name"], project_id=wished_cr["project_id"])
+                      if cr["name"] == wished_cr["name"]), None)
 
     payload_cr = payload_from_wished_cr(wished_cr)
 
-    if wished_cr["name"] not in cr_lookup:
+    if target_cr is None:
         changed = True
         if api.module.check_mode:
             return changed, {"status": "A container registry would be created."}
@@ -185,16 +185,15 @@ def present_strategy(api, wished_cr):
                                      data=payload_cr)
 
         if not creation_response.ok:
+            body = creation_response.json
             msg = "Error during container registry creation: %s: '%s' (%s)" % (creation_response.info['msg'],
-                                                                               creation_response.json['message'],
-                                                                               creation_response.json)
+                                                                               body['message'],
+                                                                               body)
             api.module.fail_json(msg=msg)
 
-        api.wait_to_complete_state_transition(resource=creation_response.json, stable_states=STABLE_STATES)
-        response = api.get(path=api.api_path + "/%s" % creation_response.json["id"])
-        return changed, response.json
+        created_cr = api.wait_to_complete_state_transition(resource=creation_response.json, stable_states=STABLE_STATES)
+        return changed, created_cr
 
-    target_cr = cr_lookup[wished_cr["name"]]
     patch_payload = resource_attributes_should_be_changed(target=target_cr,
                                                           wished=payload_cr,
                                                           verifiable_mutable_attributes=MUTABLE_ATTRIBUTES,
@@ -207,16 +206,15 @@ def present_strategy(api, wished_cr):
     if api.module.check_mode:
         return changed, {"status": "Container registry attributes would be changed."}
 
-    cr_patch_response = api.patch(path=api.api_path + "/%s" % target_cr["id"],
+    cr_patch_response = api.patch(path="%s/%s" % (api.api_path, target_cr["id"]),
                                   data=patch_payload)
 
     if not cr_patch_response.ok:
         api.module.fail_json(msg='Error during container registry attributes update: [{0}: {1}]'.format(
             cr_patch_response.status_code, cr_patch_response.json['message']))
 
-    api.wait_to_complete_state_transition(resource=target_cr, stable_states=STABLE_STATES)
-    response = api.get(path=api.api_path + "/%s" % target_cr["id"])
-    return changed, response.json
+    updated_cr = api.wait_to_complete_state_transition(resource=cr_patch_response.json, stable_states=STABLE_STATES)
+    return changed, updated_cr
 
 
 state_strategy = {
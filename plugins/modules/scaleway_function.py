@@ -186,17 +186,17 @@ from copy import deepcopy
 from ansible_collections.community.general.plugins.module_utils.scaleway import (
     SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway,
     scaleway_waitable_resource_argument_spec, resource_attributes_should_be_changed,
-    SecretVariables
+    payload_from_object, SecretVariables
 )
 from ansible.module_utils.basic import AnsibleModule
 
-STABLE_STATES = (
+STABLE_STATES = frozenset({
     "ready",
     "created",
     "absent"
-)
+})
 
-VERIFIABLE_MUTABLE_ATTRIBUTES = (
+VERIFIABLE_MUTABLE_ATTRIBUTES = frozenset({
     "description",
     "min_scale",
     "max_scale",
@@ -207,11 +207,11 @@ VERIFIABLE_MUTABLE_ATTRIBUTES = (
     "handler",
     "privacy",
     "secret_environment_variables"
-)
+})
 
-MUTABLE_ATTRIBUTES = VERIFIABLE_MUTABLE_ATTRIBUTES + (
+MUTABLE_ATTRIBUTES = VERIFIABLE_MUTABLE_ATTRIBUTES | frozenset({
     "redeploy",
-)
+})
 
 
 def payload_from_wished_fn(wished_fn):
@@ -231,26 +231,26 @@ def payload_from_wished_fn(wished_fn):
         "secret_environment_variables": SecretVariables.dict_to_list(wished_fn["secret_environment_variables"])
     }
 
-    return payload
+    return payload_from_object(payload)
 
 
 def absent_strategy(api, wished_fn):
     changed = False
 
-    fn_list = api.fetch_all_resources("functions")
-    fn_lookup = dict((fn["name"], fn)
-                     for fn in fn_list)
+    target_fn = next((fn for fn in api.iter_all_resources("functions", name=wished_fn["name"], namespace_id=wished_fn["namespace_id"])
+                      if fn["name"] == wished_fn["name"]), None)
 
-    if wished_fn["name"] not in fn_lookup:
+    if target_fn is None:
         return changed, {}
 
-    target_fn = fn_lookup[wished_fn["name"]]
     changed = True
     if api.module.check_mode:
         return changed, {"status": "Function would be destroyed"}
 
-    api.wait_to_complete_state_transition(resource=target_fn, stable_states=STABLE_STATES, force_wait=True)
-    response = api.delete(path=api.api_path + "/%s" % target_fn["id"])
+    if target_fn.get("status") not in STABLE_STATES:
+        api.wait_to_complete_state_transition(resource=target_fn, stable_states=STABLE_STATES, force_wait=True)
+
+    response = api.delete(path="%s/%s" % (api.api_path, target_fn["id"]))
     if not response.ok:
         api.module.fail_json(msg='Error deleting function [{0}: {1}]'.format(
             response.status_code, response.json))
@@ -262,13 +262,12 @@ def absent_strategy(api, wished_fn):
 def present_strategy(api, wished_fn):
     changed = False
 
-    fn_list = api.fetch_all_resources("functions")
-    fn_lookup = dict((fn["name"], fn)
-                     for fn in fn_list)
+    target_fn = next((fn for fn in api.iter_all_resources("functions", name=wished_fn["name"], namespace_id=wished_fn["namespace_id"])
+                      if fn["name"] == wished_fn["name"]), None)
 
     payload_fn = payload_from_wished_fn(wished_fn)
 
-    if wished_fn["name"] not in fn_lookup:
+    if target_fn is None:
         changed = True
         if api.module.check_mode:
             return changed, {"status": "A function would be created."}
@@ -282,16 +281,15 @@ def present_strategy(api, wished_fn):
                                      data=payload_fn)
 
         if not creation_response.ok:
+            body = creation_response.json
             msg = "Error during function creation: %s: '%s' (%s)" % (creation_response.info['msg'],
-                                                                     creation_response.json['message'],
-                                                                     creation_response.json)
+                                                                     body['message'],
+                                                                     body)
             api.module.fail_json(msg=msg)
 
-        api.wait_to_complete_state_transition(resource=creation_response.json, stable_states=STABLE_STATES)
-        response = api.get(path=api.api_path + "/%s" % creation_response.json["id"])
-        return changed, response.json
+        created_fn = api.wait_to_complete_state_transition(resource=creation_response.json, stable_states=STABLE_STATES)
+        return changed, created_fn
 
-    target_fn = fn_lookup[wished_fn["name"]]
     decoded_target_fn = deepcopy(target_fn)
     decoded_target_fn["secret_environment_variables"] = SecretVariables.decode(decoded_target_fn["secret_environment_variables"],
                                                                                payload_fn["secret_environment_variables"])
@@ -308,16 +306,15 @@ def present_strategy(api, wished_fn):
     if api.module.check_mode:
         return changed, {"status": "Function attributes would be changed."}
 
-    fn_patch_response = api.patch(path=api.api_path + "/%s" % target_fn["id"],
+    fn_patch_response = api.patch(path="%s/%s" % (api.api_path, target_fn["id"]),
                                   data=patch_payload)
 
     if not fn_patch_response.ok:
         api.module.fail_json(msg='Error during function attributes update: [{0}: {1}]'.format(
             fn_patch_response.status_code, fn_patch_response.json['message']))
 
-    api.wait_to_complete_state_transition(resource=target_fn, stable_states=STABLE_STATES)
-    response = api.get(path=api.api_path + "/%s" % target_fn["id"])
-    return changed, response.json
+    updated_fn = api.wait_to_complete_state_transition(resource=fn_patch_response.json, stable_states=STABLE_STATES)
+    return changed, updated_fn
 
 
 state_strategy = {
@@ -86,52 +86,49 @@ function:
 '''
 
 from ansible_collections.community.general.plugins.module_utils.scaleway import (
-    SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway,
-    filter_sensitive_attributes
+    SCALEWAY_ENDPOINT, SCALEWAY_REGIONS, scaleway_argument_spec, Scaleway
 )
 from ansible.module_utils.basic import AnsibleModule
 
-SENSITIVE_ATTRIBUTES = (
+SENSITIVE_ATTRIBUTES = frozenset({
     "secret_environment_variables",
-)
+})
+
+DETAIL_ATTRIBUTES = frozenset({
+    "environment_variables",
+    "secret_environment_variables",
+    "domain_name",
+    "status",
+})
 
 
 def info_strategy(api, wished_fn):
-    fn_list = api.fetch_all_resources("functions")
-    fn_lookup = dict((fn["name"], fn)
-                     for fn in fn_list)
+    target_fn = next((fn for fn in api.iter_all_resources("functions", name=wished_fn["name"], namespace_id=wished_fn["namespace_id"])
+                      if fn["name"] == wished_fn["name"]), None)
 
-    if wished_fn["name"] not in fn_lookup:
+    if target_fn is None:
         msg = "Error during function lookup: Unable to find function named '%s' in namespace '%s'" % (wished_fn["name"],
                                                                                                       wished_fn["namespace_id"])
 
         api.module.fail_json(msg=msg)
 
-    target_fn = fn_lookup[wished_fn["name"]]
-
-    response = api.get(path=api.api_path + "/%s" % target_fn["id"])
-    if not response.ok:
-        msg = "Error during function lookup: %s: '%s' (%s)" % (response.info['msg'],
-                                                               response.json['message'],
-                                                               response.json)
-        api.module.fail_json(msg=msg)
-
-    return response.json
+    return api.fetch_resource_details(target_fn, DETAIL_ATTRIBUTES, "function")
 
 
 def core(module):
-    region = module.params["region"]
+    params = module.params
     wished_function = {
-        "namespace_id": module.params["namespace_id"],
-        "name": module.params["name"]
+        "namespace_id": params["namespace_id"],
+        "name": params["name"]
     }
 
     api = Scaleway(module=module)
-    api.api_path = "functions/v1beta1/regions/%s/functions" % region
+    api.api_path = "functions/v1beta1/regions/%s/functions" % params["region"]
+    api.sensitive_attributes = SENSITIVE_ATTRIBUTES
 
     summary = info_strategy(api=api, wished_fn=wished_function)
 
-    module.exit_json(changed=False, function=filter_sensitive_attributes(summary, SENSITIVE_ATTRIBUTES))
+    module.exit_json(changed=False, function=summary)
 
 
 def main():
@@ -41,9 +41,11 @@ options:
       - pl-waw
 
   name:
-    type: str
+    type: list
+    elements: str
     description:
       - Name of the function namespace.
+      - Several names can be given to retrieve all of them with a single listing of the project.
     required: true
 '''
 
@@ -54,12 +56,21 @@ EXAMPLES = '''
     region: fr-par
     name: my-awesome-function-namespace
   register: function_namespace_info_task
+
+- name: Get several function namespaces info at once
+  community.general.scaleway_function_namespace_info:
+    project_id: '{{ scw_project }}'
+    region: fr-par
+    name:
+      - my-awesome-function-namespace
+      - my-other-function-namespace
+  register: function_namespaces_info_task
 '''
 
 RETURN = '''
 function_namespace:
   description: The function namespace information.
-  returned: always
+  returned: when a single I(name) is given
   type: dict
   sample:
     description: ""
@@ -77,6 +88,17 @@ function_namespace:
       - key: MY_SECRET_VAR
         value: $argon2id$v=19$m=65536,t=1,p=2$tb6UwSPWx/rH5Vyxt9Ujfw$5ZlvaIjWwNDPxD9Rdght3NarJz4IETKjpvAU3mMSmFg
     status: pending
+function_namespaces:
+  description: The function namespaces information, indexed by name.
+  returned: always
+  type: dict
+  sample:
+    my-awesome-function-namespace:
+      id: 531a1fd7-98d2-4a74-ad77-d398324304b8
+      name: my-awesome-function-namespace
+      project_id: d44cea58-dcb7-4c95-bff1-1105acb60a98
+      region: fr-par
+      status: ready
 '''
 
 from ansible_collections.community.general.plugins.module_utils.scaleway import (
@@ -84,43 +106,64 @@ from ansible_collections.community.general.plugins.module_utils.scaleway import
 )
 from ansible.module_utils.basic import AnsibleModule
 
+DETAIL_ATTRIBUTES = frozenset({
+    "environment_variables",
+    "secret_environment_variables",
+    "registry_endpoint",
+    "status",
+})
 
-def info_strategy(api, wished_fn):
-    fn_list = api.fetch_all_resources("namespaces")
-    fn_lookup = dict((fn["name"], fn)
-                     for fn in fn_list)
 
-    if wished_fn["name"] not in fn_lookup:
-        msg = "Error during function namespace lookup: Unable to find function namespace named '%s' in project '%s'" % (wished_fn["name"],
+def info_strategy(api, wished_fn):
+    if not wished_fn["names"]:
+        api.module.fail_json(msg="Error during function namespace lookup: At least one function namespace name is required")
+
+    # Keep the order of the given names to report the missing ones
+    wished_names = []
+    for name in wished_fn["names"]:
+        if name not in wished_names:
+            wished_names.append(name)
+
+    # A single name is filtered by the API, several names are looked up in one listing of the project
+    if len(wished_names) == 1:
+        fn_list = api.iter_all_resources("namespaces", name=wished_names[0], project_id=wished_fn["project_id"])
+    else:
+        fn_list = api.iter_all_resources("namespaces", project_id=wished_fn["project_id"])
+
+    target_fns = {}
+    for fn in fn_list:
+        if fn["name"] in wished_names and fn["name"] not in target_fns:
+            target_fns[fn["name"]] = fn
+            if len(target_fns) == len(wished_names):
+                break
+
+    missing_names = [name for name in wished_names if name not in target_fns]
+    if missing_names:
+        msg = "Error during function namespace lookup: Unable to find function namespace named '%s' in project '%s'" % ("', '".join(missing_names),
                                                                                                                         wished_fn["project_id"])
 
         api.module.fail_json(msg=msg)
 
-    target_fn = fn_lookup[wished_fn["name"]]
-
-    response = api.get(path=api.api_path + "/%s" % target_fn["id"])
-    if not response.ok:
-        msg = "Error during function namespace lookup: %s: '%s' (%s)" % (response.info['msg'],
-                                                                         response.json['message'],
-                                                                         response.json)
-        api.module.fail_json(msg=msg)
-
-    return response.json
+    return dict((name, api.fetch_resource_details(fn, DETAIL_ATTRIBUTES, "function namespace")) for name, fn in target_fns.items())
 
 
 def core(module):
-    region = module.params["region"]
+    params = module.params
     wished_function_namespace = {
-        "project_id": module.params["project_id"],
-        "name": module.params["name"]
+        "project_id": params["project_id"],
+        "names": params["name"]
     }
 
     api = Scaleway(module=module)
-    api.api_path = "functions/v1beta1/regions/%s/namespaces" % region
+    api.api_path = "functions/v1beta1/regions/%s/namespaces" % params["region"]
+
+    summaries = info_strategy(api=api, wished_fn=wished_function_namespace)
 
-    summary = info_strategy(api=api, wished_fn=wished_function_namespace)
+    result = dict(changed=False, function_namespaces=summaries)
+    if len(summaries) == 1:
+        result["function_namespace"] = summaries[params["name"][0]]
 
-    module.exit_json(changed=False, function_namespace=summary)
+    module.exit_json(**result)
 
 
 def main():
@@ -128,7 +171,7 @@ def main():
     argument_spec.update(dict(
         project_id=dict(type='str', required=True),
         region=dict(type='str', required=True, choices=SCALEWAY_REGIONS),
-        name=dict(type='str', required=True)
+        name=dict(type='list', elements='str', required=True)
     ))
     module = AnsibleModule(
         argument_spec=argument_spec,
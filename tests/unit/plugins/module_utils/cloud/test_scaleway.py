@@ -5,10 +5,15 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import datetime
 import random
 
 from ansible_collections.community.general.tests.unit.compat import unittest
-from ansible_collections.community.general.plugins.module_utils.scaleway import SecretVariables, argon2
+from ansible_collections.community.general.tests.unit.compat.mock import MagicMock, patch
+from ansible_collections.community.general.plugins.module_utils.scaleway import (
+    SecretVariables, argon2, Scaleway, Response,
+    resource_attributes_should_be_changed
+)
 
 
 class SecretVariablesTestCase(unittest.TestCase):
@@ -126,3 +131,244 @@ class SecretVariablesTestCase(unittest.TestCase):
         result = SecretVariables.decode(source_secret, source_value)
         result = sorted(result, key=lambda el: el['key'])
         self.assertEqual(result, expect)
+
+
+class ResourceAttributesShouldBeChangedTestCase(unittest.TestCase):
+    def test_ignore_attributes_missing_from_wished(self):
+        target = dict(description="", min_scale=0, max_scale=20)
+        wished = dict(description="new description", max_scale=20)
+
+        result = resource_attributes_should_be_changed(target, wished,
+                                                       verifiable_mutable_attributes=("description", "min_scale", "max_scale"),
+                                                       mutable_attributes=("description", "min_scale", "max_scale"))
+        self.assertEqual(result, dict(description="new description", max_scale=20))
+
+    def test_no_change(self):
+        target = dict(description="", min_scale=0)
+        wished = dict(description="")
+
+        result = resource_attributes_should_be_changed(target, wished,
+                                                       verifiable_mutable_attributes=("description", "min_scale"),
+                                                       mutable_attributes=("description", "min_scale"))
+        self.assertEqual(result, dict())
+
+
+def build_api(**params):
+    module = MagicMock()
+    module.fail_json.side_effect = SystemExit
+    module.params = dict(wait=True, wait_timeout=300, wait_sleep_time=3, query_parameters={})
+    module.params.update(params)
+
+    api = Scaleway(module=module)
+    api.api_path = "functions/v1beta1/regions/fr-par/namespaces"
+    return api
+
+
+def response(status, body=None):
+    info = {"status": status}
+    if body is not None:
+        info["body"] = body
+    return Response(None, info)
+
+
+class ResponseTestCase(unittest.TestCase):
+    def test_json_redacts_sensitive_attributes(self):
+        info = {
+            "status": 200,
+            "body": ('{"namespaces": [{"id": "531a1fd7", "secret_environment_variables": [{"key": "MY_SECRET_VAR", "hashed_value": "$argon2id$"}]}],'
+                     ' "total_count": 1}'),
+        }
+        result = Response(None, info, sensitive_attributes=("secret_environment_variables",))
+
+        self.assertEqual(result.json, dict(namespaces=[dict(id="531a1fd7", secret_environment_variables="SENSITIVE_VALUE")], total_count=1))
+
+
+@patch('ansible_collections.community.general.plugins.module_utils.scaleway.fetch_url')
+class SendTestCase(unittest.TestCase):
+    def test_compact_json_body(self, mock_fetch_url):
+        mock_fetch_url.return_value = (None, {"status": 200, "body": "{}"})
+        api = build_api()
+
+        api.post(path=api.api_path, data=dict(name="my-namespace", environment_variables=dict(MY_VAR="my_value")))
+
+        self.assertEqual(mock_fetch_url.call_args[1]["data"], '{"name":"my-namespace","environment_variables":{"MY_VAR":"my_value"}}')
+
+    def test_no_body_without_data(self, mock_fetch_url):
+        mock_fetch_url.return_value = (None, {"status": 200, "body": "{}"})
+        api = build_api()
+
+        api.get(path=api.api_path)
+
+        self.assertIsNone(mock_fetch_url.call_args[1]["data"])
+
+
+class FetchAllResourcesTestCase(unittest.TestCase):
+    def test_stop_when_total_count_is_reached(self):
+        api = build_api()
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.return_value = response(200, '{"namespaces": [{"id": "531a1fd7", "name": "my-namespace"}], "total_count": 1}')
+            result = api.fetch_all_resources("namespaces", name="my-namespace")
+
+        self.assertEqual(result, [dict(id="531a1fd7", name="my-namespace")])
+        mock_scw_get.assert_called_once_with(path=api.api_path, params=dict(name="my-namespace"))
+
+    def test_fetch_every_page(self):
+        api = build_api()
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.side_effect = [
+                response(200, '{"namespaces": [{"id": "531a1fd7"}], "total_count": 2}'),
+                response(200, '{"namespaces": [{"id": "e04e3bdc"}], "total_count": 2}'),
+            ]
+            result = api.fetch_all_resources("namespaces")
+
+        self.assertEqual(result, [dict(id="531a1fd7"), dict(id="e04e3bdc")])
+        self.assertEqual(mock_scw_get.call_count, 2)
+        mock_scw_get.assert_called_with(path=api.api_path, params=dict(page=2))
+
+    def test_iterate_lazily(self):
+        api = build_api()
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.side_effect = [
+                response(200, '{"namespaces": [{"id": "531a1fd7", "name": "my-namespace"}], "total_count": 2}'),
+                response(200, '{"namespaces": [{"id": "e04e3bdc", "name": "my-namespace-2"}], "total_count": 2}'),
+            ]
+            result = next(ns for ns in api.iter_all_resources("namespaces") if ns["name"] == "my-namespace")
+
+        self.assertEqual(result, dict(id="531a1fd7", name="my-namespace"))
+        mock_scw_get.assert_called_once_with(path=api.api_path, params=dict())
+
+
+class FetchResourceDetailsTestCase(unittest.TestCase):
+    def test_reuse_complete_listed_resource(self):
+        api = build_api()
+        resource = dict(id="531a1fd7", name="my-namespace", status="ready")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            result = api.fetch_resource_details(resource, ("name", "status"), "function namespace")
+
+        self.assertIs(result, resource)
+        mock_scw_get.assert_not_called()
+
+    def test_fetch_incomplete_listed_resource(self):
+        api = build_api()
+        resource = dict(id="531a1fd7", name="my-namespace")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.return_value = response(200, '{"id": "531a1fd7", "name": "my-namespace", "status": "ready"}')
+            result = api.fetch_resource_details(resource, ("name", "status"), "function namespace")
+
+        self.assertEqual(result, dict(id="531a1fd7", name="my-namespace", status="ready"))
+        mock_scw_get.assert_called_once_with(path="%s/531a1fd7" % api.api_path)
+
+    def test_fail_when_fetch_fails(self):
+        api = build_api()
+        resource = dict(id="531a1fd7", name="my-namespace")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.return_value = Response(None, {"status": 403, "msg": "Forbidden", "body": '{"message": "permission denied"}'})
+            with self.assertRaises(SystemExit):
+                api.fetch_resource_details(resource, ("name", "status"), "function namespace")
+
+        msg = api.module.fail_json.call_args[1]["msg"]
+        self.assertTrue(msg.startswith("Error during function namespace lookup: Forbidden: 'permission denied' ("))
+
+
+@patch('ansible_collections.community.general.plugins.module_utils.scaleway.time.sleep')
+class WaitToCompleteStateTransitionTestCase(unittest.TestCase):
+    def test_return_last_fetched_resource(self, mock_sleep):
+        api = build_api()
+        resource = dict(id="531a1fd7", status="pending")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.side_effect = [
+                response(200, '{"id": "531a1fd7", "status": "pending"}'),
+                response(200, '{"id": "531a1fd7", "status": "ready", "name": "my-namespace"}'),
+            ]
+            result = api.wait_to_complete_state_transition(resource=resource, stable_states=("ready", "absent"))
+
+        self.assertEqual(result, dict(id="531a1fd7", status="ready", name="my-namespace"))
+        self.assertEqual(mock_scw_get.call_count, 2)
+
+    def test_return_none_when_resource_is_absent(self, mock_sleep):
+        api = build_api()
+        resource = dict(id="531a1fd7", status="deleting")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.return_value = response(404)
+            result = api.wait_to_complete_state_transition(resource=resource, stable_states=("ready", "absent"))
+
+        self.assertIsNone(result)
+        self.assertEqual(mock_scw_get.call_count, 1)
+
+    def test_return_given_resource_without_wait(self, mock_sleep):
+        api = build_api(wait=False)
+        resource = dict(id="531a1fd7", status="pending")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            result = api.wait_to_complete_state_transition(resource=resource, stable_states=("ready", "absent"))
+
+        self.assertIs(result, resource)
+        mock_scw_get.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    @patch('ansible_collections.community.general.plugins.module_utils.scaleway.random.uniform', return_value=1.0)
+    def test_exponential_backoff(self, mock_uniform, mock_sleep):
+        api = build_api()
+        resource = dict(id="531a1fd7", status="pending")
+
+        with patch.object(Scaleway, 'get') as mock_scw_get:
+            mock_scw_get.side_effect = [response(200, '{"id": "531a1fd7", "status": "pending"}')] * 6 + [
+                response(200, '{"id": "531a1fd7", "status": "ready"}'),
+            ]
+            api.wait_to_complete_state_transition(resource=resource, stable_states=("ready", "absent"))
+
+        sleeps = [sleep_call[0][0] for sleep_call in mock_sleep.call_args_list]
+        self.assertEqual(sleeps, [3, 3, 6, 12, 24, 30, 30])
+
+    @patch('ansible_collections.community.general.plugins.module_utils.scaleway.random.uniform', return_value=1.2)
+    def test_last_attempt_at_deadline(self, mock_uniform, mock_sleep):
+        api = build_api(wait_timeout=40)
+        resource = dict(id="531a1fd7", status="pending")
+        clock = [datetime.datetime(2022, 10, 1)]
+
+        def sleep(seconds):
+            clock[0] += datetime.timedelta(seconds=seconds)
+
+        mock_sleep.side_effect = sleep
+
+        with patch('ansible_collections.community.general.plugins.module_utils.scaleway.datetime') as mock_datetime:
+            mock_datetime.timedelta = datetime.timedelta
+            mock_datetime.datetime.utcnow.side_effect = lambda: clock[0]
+            with patch.object(Scaleway, 'get') as mock_scw_get:
+                mock_scw_get.side_effect = [response(200, '{"id": "531a1fd7", "status": "pending"}')] * 4 + [
+                    response(200, '{"id": "531a1fd7", "status": "ready"}'),
+                ]
+                result = api.wait_to_complete_state_transition(resource=resource, stable_states=("ready", "absent"))
+
+        self.assertEqual(result, dict(id="531a1fd7", status="ready"))
+        sleeps = [round(sleep_call[0][0], 3) for sleep_call in mock_sleep.call_args_list]
+        self.assertEqual(sleeps, [3, 3.6, 7.2, 14.4, 14.8])
+
+    def test_fail_after_last_attempt(self, mock_sleep):
+        api = build_api(wait_timeout=10)
+        resource = dict(id="531a1fd7", status="pending")
+        clock = [datetime.datetime(2022, 10, 1)]
+
+        def sleep(seconds):
+            clock[0] += datetime.timedelta(seconds=seconds)
+
+        mock_sleep.side_effect = sleep
+
+        with patch('ansible_collections.community.general.plugins.module_utils.scaleway.datetime') as mock_datetime:
+            mock_datetime.timedelta = datetime.timedelta
+            mock_datetime.datetime.utcnow.side_effect = lambda: clock[0]
+            with patch.object(Scaleway, 'get') as mock_scw_get:
+                mock_scw_get.return_value = response(200, '{"id": "531a1fd7", "status": "pending"}')
+                with self.assertRaises(SystemExit):
+                    api.wait_to_complete_state_transition(resource=resource, stable_states=("ready", "absent"))
+
+        self.assertEqual(clock[0], datetime.datetime(2022, 10, 1, 0, 0, 13))
+        api.module.fail_json.assert_called_once_with(msg="Server takes too long to finish its transition")
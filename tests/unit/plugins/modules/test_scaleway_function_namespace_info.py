@@ -0,0 +1,98 @@
+# Copyright (c) 2022, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import json
+import pytest
+
+
+from ansible_collections.community.general.plugins.modules import scaleway_function_namespace_info
+from ansible_collections.community.general.plugins.module_utils.scaleway import Scaleway, Response
+from ansible_collections.community.general.tests.unit.plugins.modules.utils import set_module_args
+from ansible_collections.community.general.tests.unit.compat.mock import patch
+
+PROJECT_ID = "d44cea58-dcb7-4c95-bff1-1105acb60a98"
+
+
+def namespace(name, namespace_id):
+    return ('{"id": "%s", "name": "%s", "project_id": "%s", "environment_variables": {},'
+            ' "secret_environment_variables": [], "registry_endpoint": "", "status": "ready"}' % (namespace_id, name, PROJECT_ID))
+
+
+def response_with_namespaces(*namespaces):
+    info = {"status": 200,
+            "body": '{"namespaces": [%s], "total_count": %d}' % (", ".join(namespaces), len(namespaces))
+            }
+    return Response(None, info)
+
+
+def run_module(capfd, names):
+    set_module_args({"project_id": PROJECT_ID,
+                     "region": "fr-par",
+                     "name": names
+                     })
+
+    os.environ['SCW_API_TOKEN'] = 'notrealtoken'
+    with pytest.raises(SystemExit):
+        scaleway_function_namespace_info.main()
+    del os.environ['SCW_API_TOKEN']
+
+    out, err = capfd.readouterr()
+    assert not err
+    return json.loads(out)
+
+
+def test_scaleway_function_namespace_info_several_names(capfd):
+    with patch.object(Scaleway, 'get') as mock_scw_get:
+        mock_scw_get.return_value = response_with_namespaces(namespace("namespace-1", "531a1fd7"),
+                                                             namespace("namespace-2", "e04e3bdc"),
+                                                             namespace("namespace-3", "82737d8d"))
+        result = run_module(capfd, ["namespace-1", "namespace-3"])
+
+    mock_scw_get.assert_called_once_with(path="functions/v1beta1/regions/fr-par/namespaces", params={"project_id": PROJECT_ID})
+    assert not result['changed']
+    assert sorted(result['function_namespaces']) == ["namespace-1", "namespace-3"]
+    assert result['function_namespaces']["namespace-3"]["id"] == "82737d8d"
+    assert 'function_namespace' not in result
+
+
+def test_scaleway_function_namespace_info_duplicate_names(capfd):
+    with patch.object(Scaleway, 'get') as mock_scw_get:
+        mock_scw_get.return_value = response_with_namespaces(namespace("namespace-1", "531a1fd7"))
+        result = run_module(capfd, ["namespace-1", "namespace-1"])
+
+    mock_scw_get.assert_called_once_with(path="functions/v1beta1/regions/fr-par/namespaces", params={"name": "namespace-1", "project_id": PROJECT_ID})
+    assert list(result['function_namespaces']) == ["namespace-1"]
+    assert result['function_namespace']["id"] == "531a1fd7"
+
+
+def test_scaleway_function_namespace_info_missing_name(capfd):
+    with patch.object(Scaleway, 'get') as mock_scw_get:
+        mock_scw_get.return_value = response_with_namespaces(namespace("namespace-1", "531a1fd7"))
+        result = run_module(capfd, ["namespace-1", "missing-namespace"])
+
+    assert result['failed']
+    assert result['msg'] == ("Error during function namespace lookup: Unable to find function namespace named 'missing-namespace' in project '%s'"
+                             % PROJECT_ID)
+
+
+def test_scaleway_function_namespace_info_duplicate_missing_name(capfd):
+    with patch.object(Scaleway, 'get') as mock_scw_get:
+        mock_scw_get.return_value = response_with_namespaces(namespace("namespace-1", "531a1fd7"))
+        result = run_module(capfd, ["missing-namespace", "namespace-1", "missing-namespace"])
+
+    assert result['failed']
+    assert result['msg'] == ("Error during function namespace lookup: Unable to find function namespace named 'missing-namespace' in project '%s'"
+                             % PROJECT_ID)
+
+
+def test_scaleway_function_namespace_info_no_name(capfd):
+    with patch.object(Scaleway, 'get') as mock_scw_get:
+        result = run_module(capfd, [])
+
+    mock_scw_get.assert_not_called()
+    assert result['failed']
+    assert result['msg'] == "Error during function namespace lookup: At least one function namespace name is required"